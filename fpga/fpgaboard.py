@@ -1,12 +1,116 @@
-import csv
+import gc
+import io
 import os
 
+# Row count above which cyclic GC is paused while generating constraints
+_GC_PAUSE_ROWS = 1000
+
+# IOSTANDARD strings keyed by the raw voltage column, e.g. "3.3V" -> "LVCMOS3.3";
+# shared across calls since boards only use a handful of bank voltages
+_IOSTD = {}
+
+def _flatten_mappings(connector_mappings):
+  """
+  Flatten connector_mappings[connector][pin] into a single dict keyed by
+  (connector, pin), so each CSV row costs one lookup instead of two.
+  """
+  return {(connector, pin): info
+          for connector, pins in connector_mappings.items()
+          for pin, info in pins.items()}
+
+def _pin_text(connector, pin, info):
+  """
+  Render the per-pin part of a constraint: the text that follows io_name on the
+  comment line, up to and including "[get_ports " of the PACKAGE_PIN line.
+  """
+  fpga_pin = info[0]  # First element is the FPGA pin number
+  bank = info[1]      # Second element is the bank number
+  pin_desc = info[2]  # Third element is the pin description
+  return (f" - {connector}.{pin} - {pin_desc} ({bank})\n"
+          f"set_property PACKAGE_PIN {fpga_pin} [get_ports ")
+
+def _render_pins(connector_mappings):
+  """
+  Pre-render _pin_text() for every pin on the board, keyed by (connector, pin),
+  for compile_board() where the cost is paid once per board.
+  """
+  return {key: _pin_text(key[0], key[1], info)
+          for key, info in _flatten_mappings(connector_mappings).items()}
+
+def _emit_rows(csv_data, lookup, out):
+  """
+  Parse csv_data row by row and write the matching TCL constraints to out.
+  lookup((connector, pin)) returns the pin's _pin_text() or None if unmapped.
+  """
+  # Bind hot-loop methods to locals to skip per-row attribute lookups
+  write = out.write
+  write("# Automatically generated Vivado constraints file\n")
+  write("# Generated from I/O mapping CSV data\n\n")
+
+  # Parse the csv code (plain comma-delimited records, no quoting) and
+  # emit the TCL constraints for each row as it is read
+  for line in csv_data.splitlines():
+    line = line.strip()
+    if not line:
+      continue
+    parts = line.split(',')
+    if len(parts) < 4:
+      continue
+    io_name, connector, pin_no, io_voltage = parts[:4]
+
+    # Look up the FPGA pin from the connector mappings
+    pin_text = lookup((connector, pin_no))
+    if pin_text is not None:
+      iostd = _IOSTD.get(io_voltage)
+      if iostd is None:
+        iostd = _IOSTD[io_voltage] = f"LVCMOS{io_voltage.replace('V', '')}"
+
+      # Generate the TCL constraint lines, followed by a blank line for readability,
+      # as a single string so each row costs one format and one write
+      write(f"# {io_name}{pin_text}{io_name}]\n"
+            f"set_property IOSTANDARD {iostd} [get_ports {io_name}]\n"
+            "\n")
+    else:
+      write(f"# ERROR: Could not find mapping for {io_name} on {connector}.{pin_no}\n"
+            "\n")
+
+def _run_emitter(csv_data, lookup, out):
+  """
+  Call _emit_rows(csv_data, lookup, out), pausing the cyclic GC for large inputs.
+  """
+  # Large pinouts allocate many short-lived strings/tuples; pausing the cyclic
+  # GC avoids repeated generation scans that cannot free anything here
+  if csv_data.count('\n') <= _GC_PAUSE_ROWS or not gc.isenabled():
+    _emit_rows(csv_data, lookup, out)
+    return
+
+  gc.disable()
+  try:
+    _emit_rows(csv_data, lookup, out)
+  finally:
+    gc.enable()
+
+def _emit_vivado_io(csv_data, connector_mappings, out):
+  """
+  Write Vivado TCL constraints for each CSV row to the file-like object out,
+  one line at a time, without buffering the whole output.
+  """
+  # Only format the pins the CSV actually uses
+  flat_get = _flatten_mappings(connector_mappings).get
+
+  def lookup(key):
+    info = flat_get(key)
+    return None if info is None else _pin_text(key[0], key[1], info)
+
+  _run_emitter(csv_data, lookup, out)
+
 class fpga_board:
   def __init__(self, model):
     self.model = model
 
+  @staticmethod
   def generate_vivado_io(csv_data, connector_mappings):
-  """
+    """
     Generate Vivado TCL constraints file from CSV data mapping I/O names to Prodigy connectors.
     
     Args:
@@ -15,48 +119,45 @@ class fpga_board:
         
     Returns:
         str: Vivado TCL constraints file content
-  """
+    """
+
+    out = io.StringIO()
+    _emit_vivado_io(csv_data, connector_mappings, out)
+    # Every line is newline-terminated when streamed; drop the final one to
+    # keep the returned string identical to the previous "\n".join() output
+    return out.getvalue()[:-1]
 
-    # Parse the csv code
-    io_mappings = []
-    csv_reader = csv.reader(io.StringIO(csv_data))
-    for row in csv_reader:
-      if len(row) >= 4:
-        io_name, prodigy_connector, pin_no, io_voltage = row[:4]
-        io_mappings.append({
-            'io_name': io_name,
-            'prodigy_connector': prodigy_connector,
-            'pin_no': pin_no,
-            'io_voltage': io_voltage
-        })
-
-    # Generate the TCL constraints
-    tcl_content = []
-    tcl_content.append("# Automatically generated Vivado constraints file")
-    tcl_content.append("# Generated from I/O mapping CSV data\n")
+  @staticmethod
+  def write_vivado_io(csv_data, connector_mappings, out):
+    """
+    Stream Vivado TCL constraints to an open file instead of returning a string.
     
-    for mapping in io_mappings:
-        io_name = mapping['io_name']
-        connector = mapping['prodigy_connector']
-        pin_no = mapping['pin_no']
-        io_voltage = mapping['io_voltage']
-        
-        # Look up the FPGA pin from the connector mappings
-    if connector in connector_mappings and pin_no in connector_mappings[connector]:
-        fpga_pin_info = connector_mappings[connector][pin_no]
-        fpga_pin = fpga_pin_info[0]  # First element is the FPGA pin number
-        bank = fpga_pin_info[1]      # Second element is the bank number
-        pin_desc = fpga_pin_info[2]  # Third element is the pin description
-            
-        # Generate the TCL constraint line
-        tcl_content.append(f"# {io_name} - {connector}.{pin_no} - {pin_desc} ({bank})")
-        tcl_content.append(f"set_property PACKAGE_PIN {fpga_pin} [get_ports {io_name}]")
-        tcl_content.append(f"set_property IOSTANDARD LVCMOS{io_voltage.replace('V', '')} [get_ports {io_name}]")
-            
-        # Add a blank line for readability
-        tcl_content.append("")
-    else:
-        tcl_content.append(f"# ERROR: Could not find mapping for {io_name} on {connector}.{pin_no}")
-        tcl_content.append("")
+    Args:
+        csv_data (str): CSV string with format "io_name,prodigy_connector,pins_no,io_voltage"
+        connector_mappings (dict): Dictionary mapping connector pins to FPGA pins
+        out: Writable text file-like object, e.g. an open .tcl/.xdc file
+    """
+    _emit_vivado_io(csv_data, connector_mappings, out)
+
+  @staticmethod
+  def compile_board(connector_mappings):
+    """
+    Build a generate_vivado_io() equivalent specialized for one board, for
+    reuse when many CSVs target the same connector mappings. The board's pin
+    table is rendered once, so later edits to connector_mappings need a new
+    compile_board() call.
     
-    return "\n".join(tcl_content)
+    Args:
+        connector_mappings (dict): Dictionary mapping connector pins to FPGA pins
+        
+    Returns:
+        callable: Function taking csv_data (str) and returning the TCL constraints (str)
+    """
+    lookup = _render_pins(connector_mappings).get
+
+    def generate(csv_data):
+      out = io.StringIO()
+      _run_emitter(csv_data, lookup, out)
+      return out.getvalue()[:-1]
+
+    return generate
@@ -0,0 +1,256 @@
+/*
+ * Native launcher for the `vcs` mode of verdi_vcs.py.
+ *
+ * Accepts the `verdi_vcs.py vcs ...` options spelled out in full (no
+ * abbreviations, --opt=value or -fvalue forms), builds the VCS compile
+ * command and execs it directly, skipping Python start-up and argparse.
+ * verdi_vcs.py re-execs this binary when ICSIM_FAST=1 and every option is
+ * listed in its FAST_VCS_OPTIONS.
+ *
+ * Build: cc -O2 -o vcs_launch vcs_launch.c
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+#include <sys/types.h>
+#include <sys/wait.h>
+
+#define DEFAULT_TIMESCALE "1ns/1ps"
+#define COVERAGE_OPTION   "-cm line+cond+fsm+branch+tgl"
+
+struct vcs_args {
+    const char *timescale;
+    const char *filelist;
+    const char *workdir;
+    int debug, coverage, full64, sverilog, run, gui, verbose;
+    char **includes;  int n_includes;
+    char **plusargs;  int n_plusargs;
+    char **sources;   int n_sources;
+};
+
+static void usage(void)
+{
+    fprintf(stderr,
+            "usage: vcs_launch vcs [-timescale TIMESCALE] [-debug] [-coverage] [-full64]\n"
+            "                      [-sverilog] [-f FILELIST] [-run] [-gui] [-exec]\n"
+            "                      [-workdir WORKDIR] [-verbose] [-includes INCLUDES ...]\n"
+            "                      [-plusargs [PLUSARGS ...]] [sources ...]\n");
+    exit(2);
+}
+
+static int is_option(const char *arg)
+{
+    return arg[0] == '-' && arg[1] != '\0';
+}
+
+/* Collect argv[*i+1..] up to the next option, like argparse nargs='*' / '+'. */
+static char **take_list(int argc, char **argv, int *i, int *count, int at_least_one)
+{
+    char **list = &argv[*i + 1];
+    int n = 0;
+
+    while (*i + 1 + n < argc && !is_option(argv[*i + 1 + n]))
+        n++;
+    if (at_least_one && n == 0)
+        usage();
+    *i += n;
+    *count = n;
+    return list;
+}
+
+static const char *take_value(int argc, char **argv, int *i)
+{
+    if (*i + 1 >= argc)
+        usage();
+    return argv[++*i];
+}
+
+static void parse_args(int argc, char **argv, struct vcs_args *a)
+{
+    int i;
+    /* Like argparse, sources must be one contiguous run of positionals */
+    int sources_ended = 0;
+
+    memset(a, 0, sizeof(*a));
+    a->timescale = DEFAULT_TIMESCALE;
+    a->sources = calloc(argc, sizeof(char *));
+    if (!a->sources) {
+        perror("vcs_launch");
+        exit(1);
+    }
+
+    for (i = 2; i < argc; i++) {
+        const char *arg = argv[i];
+
+        if (is_option(arg) && a->n_sources > 0)
+            sources_ended = 1;
+
+        if (!strcmp(arg, "-timescale"))
+            a->timescale = take_value(argc, argv, &i);
+        else if (!strcmp(arg, "-f") || !strcmp(arg, "--filelist"))
+            a->filelist = take_value(argc, argv, &i);
+        else if (!strcmp(arg, "-workdir"))
+            a->workdir = take_value(argc, argv, &i);
+        else if (!strcmp(arg, "-debug"))
+            a->debug = 1;
+        else if (!strcmp(arg, "-coverage"))
+            a->coverage = 1;
+        else if (!strcmp(arg, "-full64"))
+            a->full64 = 1;
+        else if (!strcmp(arg, "-sverilog"))
+            a->sverilog = 1;
+        else if (!strcmp(arg, "-run"))
+            a->run = 1;
+        else if (!strcmp(arg, "-gui"))
+            a->gui = 1;
+        else if (!strcmp(arg, "-verbose"))
+            a->verbose = 1;
+        else if (!strcmp(arg, "-exec"))
+            ;  /* the launcher always execs the final command */
+        else if (!strcmp(arg, "-includes"))
+            a->includes = take_list(argc, argv, &i, &a->n_includes, 1);
+        else if (!strcmp(arg, "-plusargs"))
+            a->plusargs = take_list(argc, argv, &i, &a->n_plusargs, 0);
+        else if (is_option(arg) || sources_ended)
+            usage();
+        else
+            a->sources[a->n_sources++] = argv[i];
+    }
+}
+
+/* Print arg quoted for a POSIX shell, matching Python's shlex.quote(). */
+static void print_quoted(const char *arg)
+{
+    const char *p;
+
+    if (*arg && strspn(arg, "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+                            "0123456789@%+=:,./_-") == strlen(arg)) {
+        fputs(arg, stdout);
+        return;
+    }
+    putchar('\'');
+    for (p = arg; *p; p++) {
+        if (*p == '\'')
+            fputs("'\"'\"'", stdout);
+        else
+            putchar(*p);
+    }
+    putchar('\'');
+}
+
+static void print_cmd(const char *what, char **cmd)
+{
+    printf("%s: ", what);
+    print_quoted(*cmd);
+    for (cmd++; *cmd; cmd++) {
+        putchar(' ');
+        print_quoted(*cmd);
+    }
+    printf("\n");
+    fflush(stdout);
+}
+
+int main(int argc, char **argv)
+{
+    struct vcs_args a;
+    char **compile_cmd, **sim_cmd;
+    char *timescale_opt;
+    int n = 0, k, status;
+    pid_t pid;
+
+    if (argc < 2 || strcmp(argv[1], "vcs"))
+        usage();
+    parse_args(argc, argv, &a);
+
+    /* Build compilation command */
+    compile_cmd = calloc(12 + a.n_sources + a.n_includes, sizeof(char *));
+    timescale_opt = malloc(strlen("-timescale=") + strlen(a.timescale) + 1);
+    if (!compile_cmd || !timescale_opt) {
+        perror("vcs_launch");
+        return 1;
+    }
+    sprintf(timescale_opt, "-timescale=%s", a.timescale);
+
+    compile_cmd[n++] = "vcs";
+    compile_cmd[n++] = timescale_opt;
+    if (a.debug)
+        compile_cmd[n++] = "-debug_all";
+    if (a.coverage)
+        compile_cmd[n++] = COVERAGE_OPTION;
+    if (a.full64)
+        compile_cmd[n++] = "-full64";
+    if (a.sverilog)
+        compile_cmd[n++] = "-sverilog";
+    if (a.filelist) {
+        compile_cmd[n++] = "-f";
+        compile_cmd[n++] = (char *)a.filelist;
+    }
+    for (k = 0; k < a.n_sources; k++)
+        compile_cmd[n++] = a.sources[k];
+    for (k = 0; k < a.n_includes; k++) {
+        compile_cmd[n] = malloc(strlen("+incdir+") + strlen(a.includes[k]) + 1);
+        if (!compile_cmd[n]) {
+            perror("vcs_launch");
+            return 1;
+        }
+        sprintf(compile_cmd[n++], "+incdir+%s", a.includes[k]);
+    }
+    compile_cmd[n] = NULL;
+
+    if (a.workdir && chdir(a.workdir) != 0) {
+        perror(a.workdir);
+        return 1;
+    }
+
+    if (a.verbose)
+        print_cmd("Executing VCS compilation", compile_cmd);
+
+    /* Compile only: hand the process over to vcs */
+    if (!a.run) {
+        execvp(compile_cmd[0], compile_cmd);
+        perror("Error in VCS execution");
+        return 1;
+    }
+
+    pid = fork();
+    if (pid < 0) {
+        perror("fork");
+        return 1;
+    }
+    if (pid == 0) {
+        execvp(compile_cmd[0], compile_cmd);
+        perror("Error in VCS execution");
+        _exit(127);
+    }
+    if (waitpid(pid, &status, 0) < 0) {
+        perror("waitpid");
+        return 1;
+    }
+    if (!WIFEXITED(status) || WEXITSTATUS(status) != 0) {
+        fprintf(stderr, "Error in VCS execution: vcs returned %d\n",
+                WIFEXITED(status) ? WEXITSTATUS(status) : -1);
+        return 1;
+    }
+
+    /* Run simulation */
+    sim_cmd = calloc(3 + a.n_plusargs, sizeof(char *));
+    if (!sim_cmd) {
+        perror("vcs_launch");
+        return 1;
+    }
+    n = 0;
+    sim_cmd[n++] = "./simv";
+    if (a.gui)
+        sim_cmd[n++] = "-gui";
+    for (k = 0; k < a.n_plusargs; k++)
+        sim_cmd[n++] = a.plusargs[k];
+    sim_cmd[n] = NULL;
+
+    if (a.verbose)
+        print_cmd("Executing simulation", sim_cmd);
+    execv(sim_cmd[0], sim_cmd);
+    perror("Error in VCS execution");
+    return 1;
+}
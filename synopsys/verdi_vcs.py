@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import shlex
+import signal
 import subprocess
 import sys
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+# Exact `vcs` option spellings understood by vcs_launch.c; command lines using
+# anything else (abbreviations, --opt=value, -fvalue, --, -h) stay in Python
+FAST_VCS_OPTIONS = frozenset([
+    '-timescale', '-debug', '-coverage', '-full64', '-sverilog', '-f', '--filelist',
+    '-run', '-gui', '-exec', '-workdir', '-verbose', '-includes', '-plusargs',
+])
+
 class ICSimulation:
     def __init__(self):
         self.vcs_options = {
@@ -24,54 +34,151 @@ class ICSimulation:
             'nWave_options': ['-ssf', '-fsdb'],
             'analysis_options': ['upf', 'power']
         }
+        
+        # Built on first use by main() and reused for later calls
+        self._parser: Optional[argparse.ArgumentParser] = None
+
+    def build_vcs_commands(self, args: argparse.Namespace) -> Tuple[List[str], Optional[List[str]]]:
+        """
+        Build the VCS compile command and, if requested, the simulation command
+        """
+        # Build compilation command
+        compile_cmd = [
+            'vcs',
+            '-timescale=' + args.timescale,
+            *(['-debug_all'] if args.debug else []),
+            *(self.vcs_options['coverage_options'] if args.coverage else []),
+            *(['-full64'] if args.full64 else []),
+            *(['-sverilog'] if args.sverilog else []),
+            # Add source files
+            *(['-f', args.filelist] if args.filelist else []),
+            *args.sources,
+            # Add include directories
+            *['+incdir+' + inc for inc in args.includes or ()],
+        ]
+        
+        # Build simulation command if requested
+        sim_cmd = None
+        if args.run:
+            sim_cmd = ['./simv']
+            if args.gui:
+                sim_cmd.append('-gui')
+            if args.plusargs:
+                sim_cmd.extend(args.plusargs)
+        
+        return compile_cmd, sim_cmd
 
     def run_vcs(self, args: argparse.Namespace) -> None:
         """
         Execute VCS compilation and simulation with specified options
         """
         try:
-            # Build compilation command
-            compile_cmd = ['vcs']
-            compile_cmd.extend(['-timescale=' + args.timescale])
+            compile_cmd, sim_cmd = self.build_vcs_commands(args)
             
-            if args.debug:
-                compile_cmd.extend(['-debug_all'])
-            if args.coverage:
-                compile_cmd.extend(self.vcs_options['coverage_options'])
-            if args.full64:
-                compile_cmd.extend(['-full64'])
-            if args.sverilog:
-                compile_cmd.extend(['-sverilog'])
-            
-            # Add source files
-            if args.filelist:
-                compile_cmd.extend(['-f', args.filelist])
-            for file in args.sources:
-                compile_cmd.append(file)
-                
-            # Add include directories
-            if args.includes:
-                for inc in args.includes:
-                    compile_cmd.extend(['+incdir+' + inc])
-            
-            print(f"Executing VCS compilation: {' '.join(compile_cmd)}")
-            subprocess.run(compile_cmd, check=True)
+            if args.verbose:
+                print(f"Executing VCS compilation: {shlex.join(compile_cmd)}")
+            subprocess.run(compile_cmd, check=True, cwd=args.workdir)
             
             # Run simulation if requested
-            if args.run:
-                sim_cmd = ['./simv']
-                if args.gui:
-                    sim_cmd.append('-gui')
-                if args.plusargs:
-                    sim_cmd.extend(args.plusargs)
-                
-                print(f"Executing simulation: {' '.join(sim_cmd)}")
-                subprocess.run(sim_cmd, check=True)
+            if sim_cmd:
+                if args.verbose:
+                    print(f"Executing simulation: {shlex.join(sim_cmd)}")
+                if args.exec:
+                    # Nothing left to do in Python, so replace this process
+                    # with simv instead of forking a child and waiting on it
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    if args.workdir:
+                        os.chdir(args.workdir)
+                    os.execvp(sim_cmd[0], sim_cmd)
+                self._launch_sim(sim_cmd, args.workdir)
                 
         except subprocess.CalledProcessError as e:
             print(f"Error in VCS execution: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def _launch_sim(self, sim_cmd: List[str], workdir: Optional[str]) -> None:
+        """
+        Run the simulation and wait for it, raising CalledProcessError on failure.
+        Uses posix_spawn where available to avoid duplicating this process's
+        page tables on fork; posix_spawn cannot change directory, so -workdir
+        runs go through subprocess.
+        """
+        if workdir or not hasattr(os, 'posix_spawn'):
+            subprocess.run(sim_cmd, check=True, cwd=workdir)
+            return
+        
+        pid = os.posix_spawn(sim_cmd[0], sim_cmd, os.environ)
+        try:
+            _, status = os.waitpid(pid, 0)
+        except BaseException:
+            # Like subprocess.run: on Ctrl-C or another error, don't leave the
+            # simulation running or unreaped
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            os.waitpid(pid, 0)
+            raise
+        
+        if os.WIFSIGNALED(status):
+            returncode = -os.WTERMSIG(status)
+        else:
+            returncode = os.WEXITSTATUS(status)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, sim_cmd)
+
+    async def _run_one(self, args: argparse.Namespace, limit: asyncio.Semaphore) -> int:
+        """
+        Compile and optionally simulate one batch entry, returning its exit code
+        """
+        compile_cmd, sim_cmd = self.build_vcs_commands(args)
+        async with limit:
+            for cmd in (compile_cmd, sim_cmd):
+                if not cmd:
+                    continue
+                if args.verbose:
+                    print(f"Executing: {shlex.join(cmd)}")
+                try:
+                    proc = await asyncio.create_subprocess_exec(*cmd, cwd=args.workdir)
+                except OSError as e:
+                    print(f"Error in VCS execution: {e}", file=sys.stderr)
+                    return 127
+                if await proc.wait() != 0:
+                    print(f"Error in VCS execution: {shlex.join(cmd)} returned {proc.returncode}",
+                          file=sys.stderr)
+                    return proc.returncode
+        return 0
+
+    async def run_vcs_many(self, list_of_args: List[argparse.Namespace],
+                           workers: Optional[int] = None) -> List[int]:
+        """
+        Run several VCS compile/simulate jobs concurrently, up to `workers` at
+        a time (default: CPU count). When there is more than one job, each must
+        set its own -workdir so concurrent jobs do not overwrite each other's
+        simv and csrc/; a missing or shared -workdir raises ValueError.
+        Returns the exit code of each job, in input order.
+        """
+        if len(list_of_args) > 1:
+            workdirs = set()
+            for args in list_of_args:
+                if not args.workdir:
+                    raise ValueError('each batched VCS job needs its own -workdir')
+                workdir = os.path.realpath(args.workdir)
+                if workdir in workdirs:
+                    raise ValueError(f"-workdir {args.workdir} is used by more than one batched VCS job")
+                workdirs.add(workdir)
+        
+        limit = asyncio.Semaphore(workers or os.cpu_count() or 1)
+        return await asyncio.gather(*[self._run_one(a, limit) for a in list_of_args])
+
+    def run_batch(self, list_of_args: List[argparse.Namespace],
+                  workers: Optional[int] = None) -> List[int]:
+        """
+        Blocking wrapper around run_vcs_many() for callers without an event loop
+        """
+        return asyncio.run(self.run_vcs_many(list_of_args, workers))
+
     def run_verdi(self, args: argparse.Namespace) -> None:
         """
         Execute Verdi debug session with specified options
@@ -92,7 +199,8 @@ class ICSimulation:
             for file in args.sources:
                 cmd.append(file)
             
-            print(f"Launching Verdi: {' '.join(cmd)}")
+            if args.verbose:
+                print(f"Launching Verdi: {shlex.join(cmd)}")
             subprocess.run(cmd, check=True)
             
         except subprocess.CalledProcessError as e:
@@ -127,6 +235,11 @@ class ICSimulation:
                                help='Run simulation after compilation')
         vcs_parser.add_argument('-gui', action='store_true',
                                help='Run simulation in GUI mode')
+        vcs_parser.add_argument('-exec', action='store_true',
+                               help='Replace this process with simv after compilation')
+        vcs_parser.add_argument('-workdir', help='Directory to compile and simulate in')
+        vcs_parser.add_argument('-verbose', action='store_true',
+                               help='Print the commands being executed')
         vcs_parser.add_argument('-includes', nargs='+', help='Include directories')
         vcs_parser.add_argument('sources', nargs='*', help='Source files')
         vcs_parser.add_argument('-plusargs', nargs='*',
@@ -138,6 +251,8 @@ class ICSimulation:
                                 help='Debug mode')
         verdi_parser.add_argument('-ssf', help='Signal dump file')
         verdi_parser.add_argument('-upf', help='UPF file for power analysis')
+        verdi_parser.add_argument('-verbose', action='store_true',
+                                help='Print the command being executed')
         verdi_parser.add_argument('-f', '--filelist', help='File containing source files list')
         verdi_parser.add_argument('sources', nargs='*', help='Source files')
         
@@ -147,7 +262,19 @@ class ICSimulation:
         """
         Main entry point for the script
         """
-        parser = self.setup_parser()
+        # With ICSIM_FAST=1, hand plain command-line `vcs` runs to the native
+        # launcher (see vcs_launch.c) to skip interpreter and argparse overhead
+        if args is None and os.environ.get('ICSIM_FAST') == '1':
+            launcher = Path(__file__).resolve().with_name('vcs_launch')
+            options = [arg for arg in sys.argv[2:] if arg.startswith('-') and arg != '-']
+            if (sys.argv[1:2] == ['vcs'] and FAST_VCS_OPTIONS.issuperset(options)
+                    and os.access(launcher, os.X_OK)):
+                sys.stdout.flush()
+                os.execv(launcher, [str(launcher)] + sys.argv[1:])
+
+        if self._parser is None:
+            self._parser = self.setup_parser()
+        parser = self._parser
         args = parser.parse_args(args)
         
         if args.tool is None: